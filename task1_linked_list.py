@@ -1,30 +1,92 @@
+import heapq
+import sys
+from array import array
+from collections import deque
+from itertools import islice
+
+
 class Node:
+    # No per-node __dict__: roughly halves the size of every node
+    __slots__ = ("value", "next")
+
     def __init__(self, value):
         self.value = value
         self.next = None
 
 
-class LinkedList:
+class LinkedListViews:
+    """Read-only lazy views shared by both list types; they rely on __iter__ and length."""
+
+    def __len__(self):
+        return self.length
+
+    def to_list(self):
+        return list(self)
+
+    # Values from positions start..stop (step apart) without copying the list
+    def iter_slice(self, start=0, stop=None, step=1):
+        return islice(self, start, stop, step)
+
+    # Sliding windows of size values, advancing step values at a time
+    def windows(self, size, step=1):
+        window = deque(maxlen=size)
+        pending = size
+        for value in self:
+            window.append(value)
+            pending -= 1
+            if pending == 0:
+                yield tuple(window)
+                pending = step
+
+    # Lazily yield the merge of sorted lists, nodes stay untouched
+    @staticmethod
+    def iter_merged(*lists):
+        # Later lists win ties, same as merge_sorted
+        return heapq.merge(*reversed(lists))
+
+
+class LinkedList(LinkedListViews):
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.length = 0
 
+    # O(1) append through the tracked tail
     def append(self, value):
         new_node = Node(value)
         if not self.head:
             self.head = new_node
-            return
-        current = self.head
-        while current.next:
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    @classmethod
+    def from_iterable(cls, values):
+        linked_list = cls()
+        linked_list.extend(values)
+        return linked_list
+
+    # Re-derive tail and length after the nodes were relinked
+    def _relink(self, head: Node):
+        self.head = head
+        self.tail = None
+        self.length = 0
+        current = head
+        while current:
+            self.tail = current
+            self.length += 1
             current = current.next
-        current.next = new_node
 
-    def to_list(self):
-        result = []
+    def __iter__(self):
         current = self.head
         while current:
-            result.append(current.value)
+            yield current.value
             current = current.next
-        return result
 
     # Reverse linked list
     def reverse(self):
@@ -35,7 +97,7 @@ class LinkedList:
             current.next = prev
             prev = current
             current = next_node
-        self.head = prev
+        self.head, self.tail = prev, self.head
 
     @staticmethod
     def _merge_sorted_lists(l1: Node, l2: Node) -> Node:
@@ -65,8 +127,17 @@ class LinkedList:
         tail.next = l1 if l1 else l2
         return head
 
-    # Merge sort
-    def merge_sort(self):
+    # Merge sort: "top_down" (recursive), "bottom_up" or "natural" (both iterative)
+    def merge_sort(self, method="top_down"):
+        if method == "bottom_up":
+            self._relink(self._merge_runs(self._runs(self.head, natural=False)))
+            return
+        if method == "natural":
+            self._relink(self._merge_runs(self._runs(self.head, natural=True)))
+            return
+        if method != "top_down":
+            raise ValueError(f"Unknown merge sort method: {method}")
+
         def sort(head: Node) -> Node:
             if not head or not head.next:
                 return head
@@ -84,24 +155,202 @@ class LinkedList:
 
             return LinkedList._merge_sorted_lists(left, right)
 
-        self.head = sort(self.head)
+        self._relink(sort(self.head))
+
+    @staticmethod
+    def _runs(head: Node, natural: bool):
+        """Cut the chain into detached runs: single nodes, or maximal ascending runs."""
+        while head:
+            tail = head
+            if natural:
+                while tail.next and not tail.next.value < tail.value:
+                    tail = tail.next
+            rest = tail.next
+            tail.next = None
+            yield head
+            head = rest
 
+    @staticmethod
+    def _merge_runs(runs) -> Node:
+        """
+        Bottom-up merge without recursion or midpoint scans:
+        bins[i] holds an already merged block of about 2**i runs, like a binary counter.
+        """
+        bins = []
+        for run in runs:
+            level = 0
+            while level < len(bins) and bins[level] is not None:
+                run = LinkedList._merge_sorted_lists(bins[level], run)
+                bins[level] = None
+                level += 1
+            if level == len(bins):
+                bins.append(run)
+            else:
+                bins[level] = run
+
+        head = None
+        for block in bins:
+            if block is not None:
+                head = LinkedList._merge_sorted_lists(block, head)
+        return head
+
+    # Merge any number of sorted lists into a new list; the inputs are left untouched,
+    # same as CompactLinkedList.merge_sorted. Ties go to the later list.
     @classmethod
-    def merge_sorted(cls, list1, list2):
-        merged_list = cls()
-        merged_list.head = cls._merge_sorted_lists(list1.head, list2.head)
-        return merged_list
+    def merge_sorted(cls, *lists):
+        return cls.from_iterable(heapq.merge(*reversed(lists)))
 
+    # Bytes held by the nodes and their values
+    def memory_usage(self):
+        total = sys.getsizeof(self)
+        current = self.head
+        while current:
+            total += sys.getsizeof(current) + sys.getsizeof(current.value)
+            current = current.next
+        return total
 
-if __name__ == "__main__":
-    ll1 = LinkedList()
-    ll2 = LinkedList()
 
-    for v in [3, 1, 5, 7, 9, 0, 8]:
-        ll1.append(v)
+class CompactLinkedList(LinkedListViews):
+    """
+    Linked list stored as a pool of parallel arrays: values[i] and next[i] (-1 ends the list).
+    With a typecode ("q", "d", ...) values live unboxed in a typed array.
+    """
 
-    for v in [4, 2, 6, 10, -1, 11, 5]:
-        ll2.append(v)
+    def __init__(self, typecode=None):
+        self.typecode = typecode
+        self.values = array(typecode) if typecode else []
+        self.next = array("i")
+        self.head = -1
+        self.tail = -1
+        self.length = 0
+
+    def append(self, value):
+        index = len(self.values)
+        self.values.append(value)
+        self.next.append(-1)
+        if self.head == -1:
+            self.head = index
+        else:
+            self.next[self.tail] = index
+        self.tail = index
+        self.length += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    @classmethod
+    def from_iterable(cls, values, typecode=None):
+        linked_list = cls(typecode)
+        linked_list.extend(values)
+        return linked_list
+
+    def __iter__(self):
+        values, next_index = self.values, self.next
+        current = self.head
+        while current != -1:
+            yield values[current]
+            current = next_index[current]
+
+    def _rebuild(self, ordered_values):
+        """Lay values out contiguously in list order, which also drops unused pool slots."""
+        self.values = array(self.typecode, ordered_values) if self.typecode else list(ordered_values)
+        count = len(self.values)
+        self.next = array("i", range(1, count + 1))
+        if count:
+            self.next[-1] = -1
+        self.head = 0 if count else -1
+        self.tail = count - 1
+        self.length = count
+
+    # Reverse linked list
+    def reverse(self):
+        prev = -1
+        current = self.head
+        next_index = self.next
+        while current != -1:
+            following = next_index[current]
+            next_index[current] = prev
+            prev = current
+            current = following
+        self.head, self.tail = prev, self.head
+
+    def _merge_chains(self, a, b):
+        """Stable merge of two -1 terminated index chains by relinking next[]."""
+        values, next_index = self.values, self.next
+        if a == -1 or b == -1:
+            return b if a == -1 else a
+
+        if values[b] < values[a]:
+            head, b = b, next_index[b]
+        else:
+            head, a = a, next_index[a]
+        tail = head
+
+        while a != -1 and b != -1:
+            if values[b] < values[a]:
+                next_index[tail], b = b, next_index[b]
+            else:
+                next_index[tail], a = a, next_index[a]
+            tail = next_index[tail]
+
+        next_index[tail] = a if a != -1 else b
+        return head
+
+    # Natural bottom-up merge sort over the next[] indices: values never move or get boxed,
+    # extra memory is one merged block per level (O(log n) ints)
+    def merge_sort(self):
+        values, next_index = self.values, self.next
+        bins = []
+        current = self.head
+        while current != -1:
+            tail = current
+            while next_index[tail] != -1 and not values[next_index[tail]] < values[tail]:
+                tail = next_index[tail]
+            run, current = current, next_index[tail]
+            next_index[tail] = -1
+
+            level = 0
+            while level < len(bins) and bins[level] != -1:
+                run = self._merge_chains(bins[level], run)
+                bins[level] = -1
+                level += 1
+            if level == len(bins):
+                bins.append(run)
+            else:
+                bins[level] = run
+
+        head = -1
+        for block in bins:
+            if block != -1:
+                head = self._merge_chains(block, head)
+        self.head = head
+
+        tail = head
+        while tail != -1 and next_index[tail] != -1:
+            tail = next_index[tail]
+        self.tail = tail
+
+    # Merge into a new list, streaming through heapq.merge straight into the new pool;
+    # the inputs are left untouched, same as LinkedList.merge_sorted
+    @classmethod
+    def merge_sorted(cls, *lists):
+        typecodes = {linked_list.typecode for linked_list in lists}
+        merged_list = cls(typecodes.pop() if len(typecodes) == 1 else None)
+        merged_list._rebuild(heapq.merge(*reversed(lists)))
+        return merged_list
+
+    # Bytes held by the pool (boxed values counted only without a typecode)
+    def memory_usage(self):
+        total = sys.getsizeof(self) + sys.getsizeof(self.values) + sys.getsizeof(self.next)
+        if not self.typecode:
+            total += sum(sys.getsizeof(value) for value in self.values)
+        return total
+
+
+if __name__ == "__main__":
+    ll1 = LinkedList.from_iterable([3, 1, 5, 7, 9, 0, 8])
+    ll2 = LinkedList.from_iterable([4, 2, 6, 10, -1, 11, 5])
 
     print("Original lists:")
     print(ll1.to_list())
@@ -120,3 +369,13 @@ if __name__ == "__main__":
     merged.reverse()
     print("Reversed merged list:")
     print(merged.to_list())
+
+    # Memory footprint of 100,000 integers
+    values = range(100_000)
+    node_list = LinkedList.from_iterable(values)
+    pooled_list = CompactLinkedList.from_iterable(values, typecode="q")
+    node_bytes, pooled_bytes = node_list.memory_usage(), pooled_list.memory_usage()
+    print("Memory for 100,000 values:")
+    print(f" -> LinkedList: {node_bytes / 1024:.0f} KiB")
+    print(f" -> CompactLinkedList('q'): {pooled_bytes / 1024:.0f} KiB "
+          f"({100 * (1 - pooled_bytes / node_bytes):.0f}% saved)")
@@ -0,0 +1,46 @@
+import os
+import random
+import tempfile
+import time
+from task3_dijkstra_algorithm import CSRGraph, Dijkstra, generate_galaxy_edges, write_edge_list
+
+
+def generated_galaxy(planets: int, junction_density: float, max_weight: int, seed: int) -> CSRGraph:
+    """Seeded synthetic galaxy, streamed through an edge-list file into CSR arrays."""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "galaxy.tsv")
+        write_edge_list(path, generate_galaxy_edges(
+            planets, arms=5, junction_density=junction_density,
+            weight=(1, max_weight), seed=seed,
+        ))
+        return CSRGraph.from_edge_list(path)
+
+
+def benchmark_queues(sizes=((10_000, 0.5), (50_000, 0.5), (20_000, 5.0)),
+                     max_weight: int = 7, sources: int = 5, seed: int = 42):
+    """Time single-source searches with every priority queue on the same galaxies."""
+    queues = ["heapq", *Dijkstra.QUEUES]
+
+    header = f"{'Planets':<10}{'Lanes':<10}" + "".join(f"{q:<12}" for q in queues)
+    print(header)
+    print("-" * len(header))
+
+    for planets, junction_density in sizes:
+        graph = generated_galaxy(planets, junction_density, max_weight, seed)
+        lanes = len(graph.targets) // 2
+        starts = [graph.nodes[i] for i in random.Random(seed).sample(range(planets), sources)]
+
+        row = f"{planets:<10,}{lanes:<10,}"
+        for queue in queues:
+            dijkstra = Dijkstra(graph, queue=queue)
+            began = time.perf_counter()
+            for start in starts:
+                dijkstra.single_source(start)
+            row += f"{(time.perf_counter() - began) / sources * 1000:<12.1f}"
+        print(row)
+
+    print("\nAverage milliseconds per single-source search")
+
+
+if __name__ == "__main__":
+    benchmark_queues()
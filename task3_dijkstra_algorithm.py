@@ -1,10 +1,129 @@
+import hashlib
 import heapq
+import json
 import math
+import mmap
+import multiprocessing as mp
+import os
 import random
+import struct
+import sys
+import time
+from array import array
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Mapping
+from itertools import accumulate
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as pe
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_hex
+from matplotlib.figure import Figure
 from matplotlib.patches import Patch
 import networkx as nx
+import numpy as np
+
+# One edit of the galaxy graph; old_weight is inf for a newly added lane
+GraphChange = namedtuple("GraphChange", "version u v old_weight new_weight new_planet")
+
+# Outcome of Dijkstra.batch: (path, distance) per query in input order plus timing
+BatchResult = namedtuple("BatchResult", "routes elapsed searches settled")
+
+
+class GalaxyStatistics:
+    """
+    Structural stats updated per added lane: degree counters bucketed by degree,
+    lane count and union-find components, so a snapshot never scans the graph.
+    """
+
+    def __init__(self):
+        self.degree = {}
+        self.by_degree = {}     # degree -> planets (dict keeps arrival order)
+        self.max_degree = 0
+        self.lanes = 0
+
+        self.parent = {}
+        self.component_size = {}    # root -> planets in its component
+        self.components = 0
+        self.largest_component = 0
+
+    def add_planet(self, planet):
+        if planet in self.degree:
+            return
+        self.degree[planet] = 0
+        self.by_degree.setdefault(0, {})[planet] = None
+        self.parent[planet] = planet
+        self.component_size[planet] = 1
+        self.components += 1
+        self.largest_component = max(self.largest_component, 1)
+
+    def add_lane(self, u, v):
+        """Count a new lane u - v (planets are registered on first sight)."""
+        self.add_planet(u)
+        self.add_planet(v)
+        self.lanes += 1
+        for planet in (u, v):
+            degree = self.degree[planet]
+            del self.by_degree[degree][planet]
+            if not self.by_degree[degree]:
+                del self.by_degree[degree]
+            self.degree[planet] = degree + 1
+            self.by_degree.setdefault(degree + 1, {})[planet] = None
+            self.max_degree = max(self.max_degree, degree + 1)
+        self._union(u, v)
+
+    def _find(self, planet):
+        parent = self.parent
+        while parent[planet] != planet:
+            parent[planet] = parent[parent[planet]]     # path halving
+            planet = parent[planet]
+        return planet
+
+    def _union(self, u, v):
+        u, v = self._find(u), self._find(v)
+        if u == v:
+            return
+        if self.component_size[u] < self.component_size[v]:
+            u, v = v, u
+        self.parent[v] = u
+        self.component_size[u] += self.component_size.pop(v)
+        self.components -= 1
+        self.largest_component = max(self.largest_component, self.component_size[u])
+
+    def connected(self, u, v) -> bool:
+        return self._find(u) == self._find(v)
+
+    def component_sizes(self) -> list[int]:
+        """Sizes of all components, largest first (one entry per component, not per planet)."""
+        return sorted(self.component_size.values(), reverse=True)
+
+    def top_hubs(self, k: int = 3) -> list[tuple]:
+        """(planet, links) for the k best-connected planets, walking degree buckets downwards."""
+        hubs = []
+        degree = self.max_degree
+        while len(hubs) < k and degree >= 0:
+            for planet in self.by_degree.get(degree, ()):
+                hubs.append((planet, degree))
+                if len(hubs) == k:
+                    break
+            degree -= 1
+        return hubs
+
+    def snapshot(self, top_k: int = 3) -> dict:
+        planets = len(self.degree)
+        hub, links = self.top_hubs(1)[0] if planets else (None, 0)
+        return {
+            "planet_count": planets,
+            "routes_count": self.lanes,
+            "avg_connections": 2 * self.lanes / planets if planets else 0,
+            "density": 2 * self.lanes / (planets * (planets - 1)) if planets > 1 else 0,
+            "is_connected": self.components == 1,
+            "main_hub": hub,
+            "hub_links": links,
+            "components": self.components,
+            "largest_component": self.largest_component,
+            "top_hubs": self.top_hubs(top_k),
+        }
 
 
 class StarWarsGalaxy:
@@ -89,97 +208,173 @@ class StarWarsGalaxy:
         ("Batuu", "Lothal"): 5,
     }
 
-    def __init__(self):
+    # Number of recent edits kept for incremental consumers (route cache, CSR snapshot)
+    CHANGELOG_SIZE = 4096
+
+    def __init__(self, routes: dict | None = None, junctions: list | None = None,
+                 weights: dict | None = None, layout: "SpiralLayout | None" = None):
+        """Defaults to the canonical holomap; pass custom tables for other galaxies."""
         self.graph = nx.Graph()
+        self.layout = layout if layout is not None else SpiralLayout()
+        routes = self.ROUTES if routes is None else routes
+        self.routes = {name: list(planets) for name, planets in routes.items()}
+        self.junctions = list(self.JUNCTIONS if junctions is None else junctions)
+        self.weights = self.WEIGHTS if weights is None else weights
         self._construct()
+        self._layout, self._layout_version = None, None
+
+        self.stats = GalaxyStatistics()
+        for planet in self.graph.nodes:
+            self.stats.add_planet(planet)
+        for u, v in self.graph.edges:
+            self.stats.add_lane(u, v)
+
+        # Edits made through the update methods below bump the version
+        self.graph.graph["version"] = 0
+        self.graph.graph["changes"] = deque(maxlen=self.CHANGELOG_SIZE)
 
     # GRAPH CONSTRUCTION
     def _construct(self):
         """Build the galactic network graph."""
-        for route_name, planets in self.ROUTES.items():
+        for route_name, planets in self.routes.items():
+            self.graph.add_nodes_from(planets)     # one-planet routes have no lanes
             for a, b in zip(planets, planets[1:]):
                 self.graph.add_edge(a, b, route=route_name)
 
-        for p1, p2 in self.JUNCTIONS:
+        for p1, p2 in self.junctions:
             self.graph.add_edge(p1, p2, route="junction")
 
         # Add weights
-        for (u, v), weight in self.WEIGHTS.items():
+        for (u, v), weight in self.weights.items():
             if self.graph.has_edge(u, v):
                 self.graph[u][v]["weight"] = weight
 
-    # GRAPH ANALYSIS
-    def statistics(self):
-        """Return major structural stats about the hyperspace map."""
-        degree_map = dict(self.graph.degree())
-        central = max(degree_map, key=degree_map.get)
-
-        return {
-            "planet_count": self.graph.number_of_nodes(),
-            "routes_count": self.graph.number_of_edges(),
-            "avg_connections": sum(degree_map.values()) / len(degree_map),
-            "density": nx.density(self.graph),
-            "is_connected": nx.is_connected(self.graph),
-            "main_hub": central,
-            "hub_links": degree_map[central],
-        }
+    @classmethod
+    def generate(cls, planets: int, arms: int = 3, junction_density: float = 0.05,
+                 weight=(1, 9), seed: int | None = None) -> "StarWarsGalaxy":
+        """Synthetic galaxy built from generate_galaxy_edges (same arguments)."""
+        # Seed every arm with its first planet: a one-planet arm yields no arm lanes
+        # but may still be reached by a junction, and the layout needs it on its route
+        routes = {f"Arm {arm + 1}": [f"A{arm + 1}-0"] for arm in range(min(arms, planets))}
+        junctions, weights = [], {}
+        for u, v, lane_weight, route in generate_galaxy_edges(planets, arms, junction_density, weight, seed):
+            if route == "junction":
+                junctions.append((u, v))
+            else:
+                routes[route].append(v)
+            weights[(u, v)] = lane_weight
+        return cls(routes, junctions, weights)
 
-    # POSITIONING SYSTEM
-    def _cosmic_positions(self):
-        """
-        Spiral galaxy placement with gravitational pull
-        for hyperspace transfer pairs so they stay close.
-        """
-        pos = {}
-        arms = len(self.ROUTES)
-        arm_spread = 0.45
-        noise = 0.25
+    # GRAPH UPDATES
+    @property
+    def version(self) -> int:
+        return self.graph.graph["version"]
 
-        # 1. Create raw spiral-arm layout
-        for arm_index, (route_name, planets) in enumerate(self.ROUTES.items()):
-            for i, planet in enumerate(planets):
-                radius = 1.5 + i * 1.3
-                angle = (arm_index * (2 * math.pi / arms)) + i * 0.55
+    def _record(self, u: str, v: str, old_weight: float, new_weight: float, new_planet: bool = False):
+        version = self.graph.graph["version"] + 1
+        self.graph.graph["version"] = version
+        self.graph.graph["changes"].append(
+            GraphChange(version, u, v, old_weight, new_weight, new_planet)
+        )
 
-                x = radius * math.cos(angle)
-                y = radius * math.sin(angle)
+    def set_weight(self, u: str, v: str, weight: float):
+        """Change the travel time of an existing hyperspace lane (blockade, closure...)."""
+        old_weight = self.graph[u][v].get("weight", 1)
+        self.graph[u][v]["weight"] = weight
+        self._record(u, v, old_weight, weight)
 
-                x += random.uniform(-noise, noise) * radius * arm_spread
-                y += random.uniform(-noise, noise) * radius * arm_spread
+    def add_route(self, u: str, v: str, route: str, weight: float = 1):
+        """Add a lane to a route; unknown planets are appended to that route."""
+        if self.graph.has_edge(u, v):
+            raise ValueError(f"Lane {u} - {v} already exists")
 
-                pos[planet] = (x, y)
+        new_planet = u not in self.graph or v not in self.graph
+        planets = self.routes.setdefault(route, [])
+        for planet in (u, v):
+            if planet not in self.graph:
+                planets.append(planet)
 
-        # 2. Apply gravitational pull between junction planets
-        for a, b in self.JUNCTIONS:
-            if a in pos and b in pos:
-                ax, ay = pos[a]
-                bx, by = pos[b]
+        self.graph.add_edge(u, v, route=route, weight=weight)
+        self.stats.add_lane(u, v)
+        self._record(u, v, float("inf"), weight, new_planet)
 
-                # midpoint between the two planets
-                mid_x = (ax + bx) / 2
-                mid_y = (ay + by) / 2
+    def add_junction(self, a: str, b: str, weight: float = 1):
+        """Add a transfer link between two existing planets."""
+        for planet in (a, b):
+            if planet not in self.graph:
+                raise ValueError(f"Unknown planet: {planet}")
+        if self.graph.has_edge(a, b):
+            raise ValueError(f"Lane {a} - {b} already exists")
 
-                # pull both planets toward the midpoint
-                pull_strength = 0.55
+        self.junctions.append((a, b))
+        self.graph.add_edge(a, b, route="junction", weight=weight)
+        self.stats.add_lane(a, b)
+        self._record(a, b, float("inf"), weight)
 
-                pos[a] = (
-                    ax + (mid_x - ax) * pull_strength,
-                    ay + (mid_y - ay) * pull_strength
-                )
-                pos[b] = (
-                    bx + (mid_x - bx) * pull_strength,
-                    by + (mid_y - by) * pull_strength
-                )
+    # GRAPH ANALYSIS
+    def statistics(self, top_k: int = 3):
+        """Return major structural stats about the hyperspace map (kept up to date incrementally)."""
+        return self.stats.snapshot(top_k)
 
-        return pos
+    # POSITIONING SYSTEM
+    def _cosmic_positions(self):
+        """
+        Spiral galaxy placement with gravitational pull
+        for hyperspace transfer pairs so they stay close.
+        """
+        return self.layout.positions(self.routes, self.junctions)
 
     # VISUALIZATION
-    def render(self, save=None, highlight_path: list[str] | None = None):
-        """Draw Star Wars galactic map without arrows, white background, fixed planet sizes."""
+    # Batched renders skip planet names and lane weights above this many visible planets
+    LABEL_LIMIT = 300
 
+    def _positions(self) -> dict:
+        """Planet layout, computed once per graph version and shared by every render."""
+        if self._layout_version != self.version:
+            self._layout = self._cosmic_positions()
+            self._layout_version = self.version
+        return self._layout
+
+    def _route_colors(self) -> dict:
+        """Holo colors per route; generated routes borrow from the tab10 palette."""
+        colors = {"junction": "#555555"}
+        extra = 0
+        for name in self.routes:
+            if name in self.ROUTE_COLORS:
+                colors[name] = self.ROUTE_COLORS[name]
+            else:
+                colors[name] = to_hex(plt.cm.tab10(extra % 10))
+                extra += 1
+        return colors
+
+    def render(self, save=None, highlight_path: list[str] | None = None, batched: bool = False,
+               view: tuple | None = None, labels: bool | None = None):
+        """
+        Draw Star Wars galactic map without arrows, white background, fixed planet sizes.
+        batched=True draws every route class as a single LineCollection for large galaxies;
+        view=(xmin, xmax, ymin, ymax) zooms in, labels=None shows them only when zoomed in enough.
+        """
         plt.style.use("default")
         plt.figure(figsize=(14, 14))
-        plt.title(
+        self._draw(plt.gca(), highlight_path, batched, view, labels)
+        plt.tight_layout()
+
+        if save:
+            plt.savefig(save, dpi=220, bbox_inches="tight", facecolor="white")
+        plt.show()
+
+    def export_png(self, path: str, highlight_path: list[str] | None = None,
+                   view: tuple | None = None, labels: bool | None = None, dpi: int = 220):
+        """Headless batched render straight to a PNG on the Agg canvas, no window is opened."""
+        with plt.style.context("default"):
+            figure = Figure(figsize=(14, 14))
+            FigureCanvasAgg(figure)
+            self._draw(figure.add_subplot(), highlight_path, True, view, labels)
+            figure.tight_layout()
+            figure.savefig(path, dpi=dpi, bbox_inches="tight", facecolor="white")
+
+    def _draw(self, ax, highlight_path, batched, view, labels):
+        ax.set_title(
             "Star Wars Galactic Map — Hyperspace Routes",
             fontsize=18,
             color="black",
@@ -193,58 +388,67 @@ class StarWarsGalaxy:
                 for u, v in zip(highlight_path[:-1], highlight_path[1:])
             )
 
-            plt.text(
+            ax.text(
                 0.5, 0.98,
                 f"Total distance of selected route: {total_distance}",
-                transform=plt.gca().transAxes,
+                transform=ax.transAxes,
                 fontsize=12,
                 fontweight="bold",
                 color="magenta",
                 horizontalalignment="center"
             )
 
-        pos = self._cosmic_positions()
+        pos = self._positions()
+        colors = self._route_colors()
 
         # Planet sizes based on PLANET_SIZES
-        planet_sizes = []
-        for planet in self.graph.nodes():
-            if planet in [j[0] for j in self.JUNCTIONS] or planet in [j[1] for j in self.JUNCTIONS]:
-                size = self.PLANET_SIZES["junction"]
-            else:
-                size = self.PLANET_SIZES.get(planet, 400)
-            planet_sizes.append(size)
+        junction_planets = {planet for pair in self.junctions for planet in pair}
+        planet_sizes = [
+            self.PLANET_SIZES["junction"] if planet in junction_planets
+            else self.PLANET_SIZES.get(planet, 400)
+            for planet in self.graph.nodes()
+        ]
+
+        def in_view(x, y):
+            return view is None or (view[0] <= x <= view[1] and view[2] <= y <= view[3])
+
+        visible = [planet for planet, (x, y) in pos.items() if in_view(x, y)]
+        if labels is None:
+            labels = not batched or len(visible) <= self.LABEL_LIMIT
 
         # Draw edges
-        for u, v, data in self.graph.edges(data=True):
-            route = data["route"]
-            color = "#555555" if route == "junction" else self.ROUTE_COLORS[route]
-            weight = data.get("weight", 1)
+        if batched:
+            self._draw_lanes_batched(ax, pos, colors, in_view if labels else None)
+        else:
+            for u, v, data in self.graph.edges(data=True):
+                color = colors[data["route"]]
+                weight = data.get("weight", 1)
 
-            # Glow effect
-            nx.draw_networkx_edges(
-                self.graph, pos,
-                edgelist=[(u, v)],
-                width=7, alpha=0.15,
-                edge_color=color
-            )
+                # Glow effect
+                nx.draw_networkx_edges(
+                    self.graph, pos, ax=ax,
+                    edgelist=[(u, v)],
+                    width=7, alpha=0.15,
+                    edge_color=color
+                )
 
-            # Main line
-            nx.draw_networkx_edges(
-                self.graph, pos,
-                edgelist=[(u, v)],
-                width=2.8, alpha=0.9,
-                edge_color=color
-            )
+                # Main line
+                nx.draw_networkx_edges(
+                    self.graph, pos, ax=ax,
+                    edgelist=[(u, v)],
+                    width=2.8, alpha=0.9,
+                    edge_color=color
+                )
 
-            # Show weight
-            x = (pos[u][0] + pos[v][0]) / 2
-            y = (pos[u][1] + pos[v][1]) / 2
-            plt.text(x, y, str(weight), fontsize=8, fontweight="bold", color="#000000",
-                     horizontalalignment='center', verticalalignment='center')
+                # Show weight
+                x = (pos[u][0] + pos[v][0]) / 2
+                y = (pos[u][1] + pos[v][1]) / 2
+                ax.text(x, y, str(weight), fontsize=8, fontweight="bold", color="#000000",
+                        horizontalalignment='center', verticalalignment='center')
 
         # Draw planets
         nx.draw_networkx_nodes(
-            self.graph, pos,
+            self.graph, pos, ax=ax,
             node_color="#A0C4FF",
             edgecolors="#000000",
             linewidths=1.6,
@@ -252,102 +456,1402 @@ class StarWarsGalaxy:
         )
 
         # Labels
-        nx.draw_networkx_labels(
-            self.graph, pos,
-            font_size=9,
-            font_weight="bold",
-            font_color="#000000",
-            labels={n:n for n in self.graph.nodes()},
-            verticalalignment="center",
-            horizontalalignment="center",
-        )
+        if labels:
+            nx.draw_networkx_labels(
+                self.graph, pos, ax=ax,
+                font_size=9,
+                font_weight="bold",
+                font_color="#000000",
+                labels={n: n for n in visible},
+                verticalalignment="center",
+                horizontalalignment="center",
+            )
 
         # Highlight a selected path if provided
         if highlight_path and len(highlight_path) > 1:
             path_edges = list(zip(highlight_path[:-1], highlight_path[1:]))
             nx.draw_networkx_edges(
-                self.graph, pos,
+                self.graph, pos, ax=ax,
                 edgelist=path_edges,
                 width=3,
                 edge_color="magenta",
                 style="solid"
             )
 
-        ax = plt.gca()
         for text in ax.texts:
             text.set_path_effects([pe.Stroke(linewidth=2, foreground="white"), pe.Normal()])
 
         # Generate Route Legends
         legend_elements = [
-            Patch(facecolor=color, edgecolor="black", label=name)
-            for name, color in self.ROUTE_COLORS.items()
+            Patch(facecolor=colors[name], edgecolor="black", label=name)
+            for name in self.routes
         ]
         # Junction Legend
         legend_elements.append(Patch(facecolor="#555555", edgecolor="black", label="Junction", linestyle="--"))
         if highlight_path:
             legend_elements.append(Patch(facecolor="magenta", edgecolor="black", label="Selected Route"))
 
-        plt.legend(handles=legend_elements, loc="upper left", fontsize=12)
+        ax.legend(handles=legend_elements, loc="upper left", fontsize=12)
 
-        plt.axis("off")
-        plt.tight_layout()
+        if view is not None:
+            ax.set_xlim(view[0], view[1])
+            ax.set_ylim(view[2], view[3])
+        ax.axis("off")
+
+    def _draw_lanes_batched(self, ax, pos, colors, weights_in_view=None):
+        """
+        One glow and one main LineCollection per route class instead of two draws per lane.
+        Lane weights are written only where weights_in_view(x, y) accepts the midpoint.
+        """
+        nodes = list(pos)
+        index = {planet: i for i, planet in enumerate(nodes)}
+        coords = np.array([pos[planet] for planet in nodes], dtype=float)
+
+        lanes = {}
+        for u, v, route in self.graph.edges(data="route"):
+            lanes.setdefault(route, ([], []))
+            lanes[route][0].append(index[u])
+            lanes[route][1].append(index[v])
+
+        for route, (starts, ends) in lanes.items():
+            segments = np.stack([coords[starts], coords[ends]], axis=1)
+            # zorder 1 like networkx edges, so the highlighted path added later stays on top
+            ax.add_collection(LineCollection(segments, colors=colors[route], linewidths=7, alpha=0.15, zorder=1))
+            ax.add_collection(LineCollection(segments, colors=colors[route], linewidths=2.8, alpha=0.9, zorder=1))
+        ax.autoscale_view()
+
+        if weights_in_view is not None:
+            for u, v, weight in self.graph.edges(data="weight", default=1):
+                x, y = (coords[index[u]] + coords[index[v]]) / 2
+                if not weights_in_view(x, y):
+                    continue
+                ax.text(x, y, str(weight), fontsize=8, fontweight="bold", color="#000000",
+                        horizontalalignment='center', verticalalignment='center')
+
+
+class SpiralLayout:
+    """
+    Seeded spiral-arm layout computed with NumPy for whole routes at once.
+    Coordinates are memoized by galaxy structure (and optionally saved to cache_dir),
+    so repeated renders and A* heuristics get them for free.
+    """
+
+    ARM_SPREAD = 0.45
+    NOISE = 0.25
+    PULL_STRENGTH = 0.55
+
+    def __init__(self, seed: int = 0, cache_dir: str | None = None):
+        self.seed = seed
+        self.cache_dir = cache_dir
+        self._memo = {}
+
+    def fingerprint(self, routes: dict, junctions: list) -> str:
+        digest = hashlib.sha1(str(self.seed).encode())
+        for name, planets in routes.items():
+            digest.update(f"\x1e{name}\x1f".encode())
+            digest.update("\x1f".join(map(str, planets)).encode())
+        for a, b in junctions:
+            digest.update(f"\x1d{a}\x1f{b}".encode())
+        return digest.hexdigest()
+
+    def positions(self, routes: dict, junctions: list) -> dict:
+        key = self.fingerprint(routes, junctions)
+        if key not in self._memo:
+            path = os.path.join(self.cache_dir, f"layout-{key}.npz") if self.cache_dir else None
+            if path and os.path.exists(path):
+                with np.load(path) as saved:
+                    names, coords = saved["names"].tolist(), saved["coords"]
+            else:
+                names, coords = self._compute(routes, junctions)
+                if path:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    np.savez(path, names=np.array(names), coords=coords)
+            self._memo[key] = dict(zip(names, map(tuple, coords.tolist())))
+        return self._memo[key]
+
+    def _compute(self, routes: dict, junctions: list) -> tuple[list, np.ndarray]:
+        rng = np.random.default_rng(self.seed)
+        arms = len(routes)
+        names, blocks = [], []
+
+        # 1. Raw spiral arms, one vectorized block per route
+        for arm_index, planets in enumerate(routes.values()):
+            i = np.arange(len(planets))
+            radius = 1.5 + i * 1.3
+            angle = arm_index * (2 * math.pi / arms) + i * 0.55
+            arm = np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+            arm += rng.uniform(-self.NOISE, self.NOISE, arm.shape) * (radius * self.ARM_SPREAD)[:, None]
+            names.extend(planets)
+            blocks.append(arm)
+
+        coords = np.concatenate(blocks) if blocks else np.empty((0, 2))
+        index = {name: i for i, name in enumerate(names)}    # a repeated planet keeps its last spot
+
+        # 2. Pull every junction pair towards its midpoint in one step
+        pairs = np.array(
+            [(index[a], index[b]) for a, b in junctions if a in index and b in index], dtype=np.intp
+        ).reshape(-1, 2)
+        if len(pairs):
+            half_gap = (coords[pairs[:, 1]] - coords[pairs[:, 0]]) / 2
+            shift = np.zeros_like(coords)
+            np.add.at(shift, pairs[:, 0], half_gap * self.PULL_STRENGTH)
+            np.add.at(shift, pairs[:, 1], -half_gap * self.PULL_STRENGTH)
+            coords += shift
+
+        return names, coords
+
+
+# SYNTHETIC GALAXIES
+def generate_galaxy_edges(planets: int, arms: int = 3, junction_density: float = 0.05,
+                          weight=(1, 9), seed: int | None = None):
+    """
+    Lazily yield (planet, planet, weight, route) lanes of a seeded synthetic galaxy.
+    Planets are split evenly over the spiral arms and chained along them,
+    then about junction_density * planets junction lanes connect planets
+    at a similar depth on two different arms.
+    weight is an inclusive (low, high) range or a callable taking the Random instance.
+    """
+    rng = random.Random(seed)
+    draw = weight if callable(weight) else (lambda r: r.randint(*weight))
+    arms = max(1, min(arms, planets))
+    sizes = [planets // arms + (arm < planets % arms) for arm in range(arms)]
+
+    for arm, size in enumerate(sizes):
+        route = f"Arm {arm + 1}"
+        for i in range(1, size):
+            yield f"A{arm + 1}-{i - 1}", f"A{arm + 1}-{i}", draw(rng), route
+
+    if arms > 1:
+        linked = set()
+        for _ in range(round(junction_density * planets)):
+            a = rng.randrange(arms)
+            b = (a + rng.randrange(1, arms)) % arms
+            i = rng.randrange(sizes[a])
+            j = min(sizes[b] - 1, max(0, i + rng.randint(-2, 2)))
+            lane = (a, i, b, j) if a < b else (b, j, a, i)
+            if lane in linked:
+                continue    # keep lanes unique so every loader sees the same graph
+            linked.add(lane)
+            yield f"A{a + 1}-{i}", f"A{b + 1}-{j}", draw(rng), "junction"
+
+
+def write_edge_list(path: str, edges):
+    """Stream (u, v, weight, ...) lanes to a tab-separated edge-list file."""
+    with open(path, "w", encoding="utf-8") as f:
+        for u, v, weight, *_ in edges:
+            f.write(f"{u}\t{v}\t{weight}\n")
+
+
+class CSRGraph:
+    """Frozen compressed-sparse-row graph with integer node ids"""
+
+    def __init__(self, nodes: list, offsets: array, targets: array, weights: array,
+                 directed: bool = False):
+        self.nodes = nodes          # id -> planet name
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.offsets = offsets      # neighbors of u live in [offsets[u], offsets[u + 1])
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self._reverse = None
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph) -> "CSRGraph":
+        """Freeze a networkx graph (e.g. StarWarsGalaxy.graph) into CSR arrays."""
+        nodes = list(graph.nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+
+        # Keep integer weights as integers so distances stay exact
+        integral = all(
+            isinstance(w, int) for _, _, w in graph.edges(data="weight", default=1)
+        )
+
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array("q" if integral else "d")
+        for node in nodes:
+            for neighbor, data in graph.adj[node].items():
+                targets.append(index[neighbor])
+                weights.append(data.get("weight", 1))
+            offsets.append(len(targets))
+
+        return cls(nodes, offsets, targets, weights, graph.is_directed())
+
+    @classmethod
+    def from_edge_list(cls, path: str, directed: bool = False) -> "CSRGraph":
+        """
+        Load a tab-separated "u<TAB>v<TAB>weight" file straight into CSR arrays.
+        Two streaming passes (count degrees, then fill slots) mean no per-edge
+        Python objects are kept; a missing weight column counts as 1.
+        """
+        nodes, index = [], {}
+        degrees = array("q")
+        integral = True
+
+        def lanes():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    fields = line.rstrip("\n").split("\t")
+                    if len(fields) >= 2 and not line.startswith("#"):
+                        yield fields
+
+        # Pass 1: planet ids, degrees and weight type
+        for fields in lanes():
+            for planet in fields[:2]:
+                if planet not in index:
+                    index[planet] = len(nodes)
+                    nodes.append(planet)
+                    degrees.append(0)
+            degrees[index[fields[0]]] += 1
+            if not directed:
+                degrees[index[fields[1]]] += 1
+            if integral and len(fields) > 2:
+                try:
+                    int(fields[2])
+                except ValueError:
+                    integral = False
+
+        offsets = array("q", [0])
+        offsets.extend(accumulate(degrees))
+        del degrees
+        targets = array("i", bytes(offsets[-1] * array("i").itemsize))
+        weights = array("q" if integral else "d", bytes(offsets[-1] * 8))
+        parse = int if integral else float
+
+        # Pass 2: drop every lane into its slot
+        fill = array("q", offsets[:-1])
+        for fields in lanes():
+            u, v = index[fields[0]], index[fields[1]]
+            weight = parse(fields[2]) if len(fields) > 2 else 1
+            targets[fill[u]], weights[fill[u]] = v, weight
+            fill[u] += 1
+            if not directed:
+                targets[fill[v]], weights[fill[v]] = u, weight
+                fill[v] += 1
+
+        return cls(nodes, offsets, targets, weights, directed)
+
+    def reversed(self) -> "CSRGraph":
+        """Graph with every edge flipped (the graph itself when undirected)."""
+        if not self.directed:
+            return self
+        if self._reverse is not None:
+            return self._reverse
+
+        n = len(self.nodes)
+        counts = [0] * (n + 1)
+        for target in self.targets:
+            counts[target + 1] += 1
+        offsets = array("q", accumulate(counts))
+
+        fill = list(offsets[:-1])
+        targets = array("i", bytes(len(self.targets) * self.targets.itemsize))
+        weights = array(self.weights.typecode, bytes(len(self.weights) * self.weights.itemsize))
+        for node in range(n):
+            for i in range(self.offsets[node], self.offsets[node + 1]):
+                target = self.targets[i]
+                targets[fill[target]] = node
+                weights[fill[target]] = self.weights[i]
+                fill[target] += 1
+
+        self._reverse = CSRGraph(self.nodes, offsets, targets, weights, directed=True)
+        self._reverse._reverse = self
+        return self._reverse
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def _position(self, u: int, v: int) -> int:
+        """Slot of edge u -> v in targets/weights, -1 if absent."""
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            if self.targets[i] == v:
+                return i
+        return -1
+
+    def edge_weight(self, u, v) -> float:
+        i = self._position(self.index[u], self.index[v])
+        if i == -1:
+            raise KeyError((u, v))
+        return self.weights[i]
+
+    def set_weight(self, u, v, weight: float) -> bool:
+        """Patch an existing edge weight in place; False if the edge or value type does not fit."""
+        if self.weights.typecode == "q" and not isinstance(weight, int):
+            return False
+        a, b = self.index.get(u), self.index.get(v)
+        if a is None or b is None:
+            return False
+
+        # Undirected lanes are stored twice; a cached reverse graph holds the flipped copy
+        slots = [(self, a, b)]
+        if not self.directed:
+            slots.append((self, b, a))
+        elif self._reverse is not None:
+            slots.append((self._reverse, b, a))
+
+        positions = [(graph, graph._position(x, y)) for graph, x, y in slots]
+        if any(i == -1 for _, i in positions):
+            return False
+        for graph, i in positions:
+            graph.weights[i] = weight
+        return True
+
+    def neighbors(self, node: int):
+        """Yield (neighbor id, weight) pairs of node id."""
+        lo, hi = self.offsets[node], self.offsets[node + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+
+class ShortestPathTree(Mapping):
+    """Distances and predecessors from a single source, paths are rebuilt on demand"""
+
+    def __init__(self, graph: CSRGraph, source: int, distances: list, previous: list):
+        self.graph = graph
+        self.source = graph.nodes[source]
+        self._source = source
+        self._distances = distances
+        self._previous = previous
+
+    def distance_to(self, goal: str) -> float:
+        return self._distances[self.graph.index[goal]]
+
+    def path_to(self, goal: str) -> list[str]:
+        path = []
+        cur = self.graph.index[goal]
+        while cur != -1:
+            path.append(self.graph.nodes[cur])
+            cur = self._previous[cur]
+        path.reverse()
+        return path
+
+    # Mapping interface: goal -> {"path": [...], "distance": ...}
+    def __getitem__(self, goal: str) -> dict:
+        if goal == self.source or self.distance_to(goal) == float("inf"):
+            raise KeyError(goal)
+        return {"path": self.path_to(goal), "distance": self.distance_to(goal)}
+
+    def __iter__(self):
+        inf = float("inf")
+        return (
+            self.graph.nodes[i] for i, d in enumerate(self._distances)
+            if d != inf and i != self._source
+        )
+
+    def __len__(self) -> int:
+        inf = float("inf")
+        return sum(1 for d in self._distances if d != inf) - 1
+
+
+# PRIORITY QUEUES
+# All queues work on integer node ids: push() inserts or lowers a key, pop() returns (key, id).
+
+class IndexedBinaryHeap:
+    """Binary min-heap with a position index, so decrease-key happens in place"""
+
+    def __init__(self, size: int, max_weight: float | None = None):
+        self.heap = []
+        self.keys = [0] * size
+        self.position = [-1] * size
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, item: int, key: float):
+        position = self.position[item]
+        if position == -1:
+            self.heap.append(item)
+            self.keys[item] = key
+            self._sift_up(len(self.heap) - 1)
+        elif key < self.keys[item]:
+            self.keys[item] = key
+            self._sift_up(position)
+
+    def pop(self) -> tuple[float, int]:
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.position[top] = -1
+        if heap:
+            heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        return self.keys[top], top
+
+    def _sift_up(self, index: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        item = heap[index]
+        key = keys[item]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if keys[heap[parent]] <= key:
+                break
+            heap[index] = heap[parent]
+            position[heap[index]] = index
+            index = parent
+        heap[index] = item
+        position[item] = index
+
+    def _sift_down(self, index: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        size = len(heap)
+        item = heap[index]
+        key = keys[item]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if keys[heap[child]] >= key:
+                break
+            heap[index] = heap[child]
+            position[heap[index]] = index
+            index = child
+        heap[index] = item
+        position[item] = index
+
+
+class _PairingNode:
+    __slots__ = ("key", "item", "child", "sibling", "prev")
+
+    def __init__(self, key: float, item: int):
+        self.key = key
+        self.item = item
+        self.child = None
+        self.sibling = None
+        self.prev = None    # parent for a first child, left sibling otherwise
+
+
+class PairingHeap:
+    """Pairing heap: O(1) insert and meld, decrease-key cuts the subtree and re-melds it"""
+
+    def __init__(self, size: int, max_weight: float | None = None):
+        self.root = None
+        self.nodes = [None] * size
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @staticmethod
+    def _meld(a: _PairingNode | None, b: _PairingNode | None) -> _PairingNode | None:
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key < a.key:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def push(self, item: int, key: float):
+        node = self.nodes[item]
+        if node is None:
+            node = self.nodes[item] = _PairingNode(key, item)
+            self.root = self._meld(self.root, node)
+            self.size += 1
+        elif key < node.key:
+            node.key = key
+            if node is self.root:
+                return
+            # Detach the subtree rooted at node, then meld it back at the top
+            if node.prev.child is node:
+                node.prev.child = node.sibling
+            else:
+                node.prev.sibling = node.sibling
+            if node.sibling is not None:
+                node.sibling.prev = node.prev
+            node.prev = node.sibling = None
+            self.root = self._meld(self.root, node)
+
+    def pop(self) -> tuple[float, int]:
+        root = self.root
+        self.nodes[root.item] = None
+        self.size -= 1
+
+        # Two-pass pairing: meld children left to right in pairs, then right to left
+        pairs = []
+        child = root.child
+        while child is not None:
+            first, second = child, child.sibling
+            child = second.sibling if second is not None else None
+            first.prev = first.sibling = None
+            if second is not None:
+                second.prev = second.sibling = None
+            pairs.append(self._meld(first, second))
+
+        merged = None
+        for heap in reversed(pairs):
+            merged = self._meld(heap, merged)
+        self.root = merged
+        return root.key, root.item
+
+
+class BucketQueue:
+    """
+    Dial's bucket queue for small non-negative integer weights:
+    every pending key lies within max_weight of the current minimum,
+    so max_weight + 1 circular buckets are enough.
+    """
+
+    def __init__(self, size: int, max_weight: int):
+        self.width = max_weight + 1
+        self.buckets = [set() for _ in range(self.width)]
+        self.keys = [None] * size
+        self.cursor = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, item: int, key: int):
+        old_key = self.keys[item]
+        if old_key is not None:
+            if key >= old_key:
+                return
+            self.buckets[old_key % self.width].discard(item)
+        else:
+            self.size += 1
+        self.keys[item] = key
+        self.buckets[key % self.width].add(item)
+
+    def pop(self) -> tuple[int, int]:
+        while not self.buckets[self.cursor % self.width]:
+            self.cursor += 1
+        item = self.buckets[self.cursor % self.width].pop()
+        key = self.keys[item]
+        self.keys[item] = None
+        self.size -= 1
+        return key, item
 
-        if save:
-            plt.savefig(save, dpi=220, bbox_inches="tight", facecolor="white")
-        plt.show()
+
+def _changes_since(changes, version: int) -> list:
+    """Changelog entries after version; versions are contiguous, so this indexes, never scans."""
+    if not changes:
+        return []
+    start = max(version - changes[0].version + 1, 0)
+    return [changes[i] for i in range(start, len(changes))]
+
+
+class RouteCache:
+    """
+    LRU cache of (start, goal) -> (path, distance) tagged with the graph version.
+    Entries are checked against the galaxy changelog on lookup,
+    so an edit only drops the routes it can actually affect.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _revalidate(entry: list, changes: list, version: int) -> bool:
+        path, distance, cached_version = entry
+        if not changes or changes[0].version > cached_version + 1:
+            return False    # the changelog no longer covers this entry
+
+        lanes = set(zip(path, path[1:]))
+        for change in _changes_since(changes, cached_version):
+            if change.new_planet:
+                continue    # a lane to a brand-new planet is a dead end for existing routes
+            on_path = (change.u, change.v) in lanes or (change.v, change.u) in lanes
+            if change.new_weight > change.old_weight:
+                if on_path:
+                    return False
+            elif on_path:
+                # Cheaper lane on the cached route: every other route gains at most as much
+                distance -= change.old_weight - change.new_weight
+            else:
+                return False
+
+        entry[1], entry[2] = distance, version
+        return True
+
+    def get(self, key: tuple, version: int, changes) -> tuple | None:
+        entry = self.entries.get(key)
+        if entry is not None and entry[2] != version:
+            if not self._revalidate(entry, changes, version):
+                del self.entries[key]
+                entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return list(entry[0]), entry[1]
+
+    def put(self, key: tuple, path: list, distance: float, version: int):
+        self.entries[key] = [list(path), distance, version]
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self.entries), "maxsize": self.maxsize}
+
+
+def euclidean_heuristic(graph: nx.Graph, positions: dict):
+    """
+    Straight-line A* heuristic over planet coordinates (e.g. from _cosmic_positions).
+    Lengths are scaled by the smallest weight/length ratio of any edge,
+    so the estimate never exceeds the real route distance.
+    """
+    scale = float("inf")
+    for u, v, weight in graph.edges(data="weight", default=1):
+        length = math.dist(positions[u], positions[v])
+        if length > 0:
+            scale = min(scale, weight / length)
+    if scale == float("inf"):
+        scale = 0
+
+    def heuristic(planet: str, goal: str) -> float:
+        return scale * math.dist(positions[planet], positions[goal])
+
+    return heuristic
+
+
+class DistanceMatrix(Mapping):
+    """All-pairs result as a V x V distance matrix plus a V x V next-hop matrix"""
+
+    def __init__(self, graph: CSRGraph, distances: np.ndarray, next_hop: np.ndarray):
+        self.graph = graph
+        self.distances = distances      # float64, inf when unreachable
+        self.next_hop = next_hop        # int32, first planet after i on the way to j
+        self._integral = graph.weights.typecode == "q"
+
+    @classmethod
+    def floyd_warshall(cls, graph: CSRGraph) -> "DistanceMatrix":
+        n = len(graph)
+        distances = np.full((n, n), np.inf)
+        next_hop = np.full((n, n), -1, dtype=np.int32)
+
+        sources = np.repeat(np.arange(n), np.diff(np.asarray(graph.offsets)))
+        targets = np.asarray(graph.targets)
+        np.minimum.at(distances, (sources, targets), np.asarray(graph.weights, dtype=np.float64))
+        next_hop[sources, targets] = targets
+        np.fill_diagonal(distances, 0)
+        np.fill_diagonal(next_hop, np.arange(n))
+
+        # Relax every pair through planet k at once
+        for k in range(n):
+            through = distances[:, k, None] + distances[None, k, :]
+            shorter = through < distances
+            np.copyto(distances, through, where=shorter)
+            np.copyto(next_hop, next_hop[:, k, None], where=shorter)
+
+        return cls(graph, distances, next_hop)
+
+    def distance(self, start: str, goal: str) -> float:
+        value = float(self.distances[self.graph.index[start], self.graph.index[goal]])
+        return int(value) if self._integral and value != math.inf else value
+
+    def path(self, start: str, goal: str) -> list[str]:
+        node, target = self.graph.index[start], self.graph.index[goal]
+        if self.next_hop[node, target] == -1:
+            return [goal]
+        path = [start]
+        while node != target:
+            node = int(self.next_hop[node, target])
+            path.append(self.graph.nodes[node])
+        return path
+
+    # Mapping interface: start -> row of goal -> {"path": [...], "distance": ...}
+    def __getitem__(self, start: str) -> "MatrixRow":
+        if start not in self.graph.index:
+            raise KeyError(start)
+        return MatrixRow(self, start)
+
+    def __iter__(self):
+        return iter(self.graph.nodes)
+
+    def __len__(self) -> int:
+        return len(self.graph)
+
+
+class MatrixRow(Mapping):
+    """One source row of a DistanceMatrix, same interface as ShortestPathTree"""
+
+    def __init__(self, matrix: DistanceMatrix, source: str):
+        self.matrix = matrix
+        self.source = source
+        self._row = matrix.distances[matrix.graph.index[source]]
+
+    def distance_to(self, goal: str) -> float:
+        return self.matrix.distance(self.source, goal)
+
+    def path_to(self, goal: str) -> list[str]:
+        return self.matrix.path(self.source, goal)
+
+    def __getitem__(self, goal: str) -> dict:
+        if goal == self.source or self.distance_to(goal) == math.inf:
+            raise KeyError(goal)
+        return {"path": self.path_to(goal), "distance": self.distance_to(goal)}
+
+    def __iter__(self):
+        nodes = self.matrix.graph.nodes
+        return (nodes[i] for i in np.flatnonzero(np.isfinite(self._row)) if nodes[i] != self.source)
+
+    def __len__(self) -> int:
+        return int(np.isfinite(self._row).sum()) - 1
 
 
 class Dijkstra:
-    """Dijkstra algorithm for weighted galaxy graph"""
+    """
+    Dijkstra algorithm for weighted galaxy graph.
+    Searches run on a CSR snapshot of the networkx graph, which only follows edits made
+    through the StarWarsGalaxy update methods (they bump graph.graph["version"]).
+    After editing the networkx graph directly, call reload().
+    """
 
-    def __init__(self, graph: nx.Graph):
+    # Selectable priority queues for _search; "heapq" keeps lazy deletion with duplicates
+    QUEUES = {
+        "binary": IndexedBinaryHeap,
+        "pairing": PairingHeap,
+        "dial": BucketQueue,
+    }
+
+    # all_paths(backend="auto") cost model, fitted on random graphs (seconds ~ 1e-9 x units):
+    # Floyd-Warshall ~ 6 n^3, n searches ~ 250 n^2 log2(n) pops + 180 n E relaxations.
+    # The matrix is also capped by memory (n^2 float64 + int32).
+    MATRIX_COST = 6
+    SEARCH_POP_COST = 250
+    SEARCH_EDGE_COST = 180
+    MATRIX_MAX_NODES = 4000
+
+    def __init__(self, graph: nx.Graph | CSRGraph, landmarks: "LandmarkIndex | None" = None,
+                 cache_size: int = 0, queue: str = "heapq"):
+        if queue != "heapq" and queue not in self.QUEUES:
+            raise ValueError(f"Unknown priority queue: {queue}")
+        self.queue = queue
         self.graph = graph
+        self.csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        self._edits = 0     # set_weight calls on a CSR-backed engine
+        self._version = self._graph_version()
+        self.settled = 0    # nodes settled by the last search
+        self.cache = RouteCache(cache_size) if cache_size else None
+        self.landmarks = None
+        if landmarks is not None:
+            self.use_landmarks(landmarks)
 
-    def shortest_path(self, start: str, goal: str) -> tuple[list[str], int]:
-        distances = {node: float("inf") for node in self.graph.nodes}
-        distances[start] = 0
-        previous = {node: None for node in self.graph.nodes}
+    def _graph_version(self) -> int:
+        return self._edits if isinstance(self.graph, CSRGraph) else self.graph.graph.get("version", 0)
 
-        heap = [(0, start)]
-        visited = set()
+    def _graph_changes(self):
+        return () if isinstance(self.graph, CSRGraph) else self.graph.graph.get("changes", ())
 
+    def _sync(self):
+        """Catch the CSR snapshot up with edits made through StarWarsGalaxy."""
+        version = self._graph_version()
+        if version == self._version:
+            return
+
+        changes = _changes_since(self._graph_changes(), self._version)
+        patched = len(changes) == version - self._version
+        for change in changes:
+            if not patched:
+                break
+            patched = change.old_weight != float("inf") and self.csr.set_weight(
+                change.u, change.v, change.new_weight
+            )
+        if not patched:
+            self.csr = CSRGraph.from_networkx(self.graph)
+
+        # Landmark bounds survive weight increases only
+        if not patched or any(c.new_weight < c.old_weight for c in changes):
+            self.landmarks = None
+        self._version = version
+
+    def reload(self):
+        """Re-snapshot a networkx galaxy edited directly, outside StarWarsGalaxy."""
+        if not isinstance(self.graph, CSRGraph):
+            self.csr = CSRGraph.from_networkx(self.graph)
+        if self.cache is not None:
+            self.cache.entries.clear()
+        self.landmarks = None
+        self._version = self._graph_version()
+
+    def set_weight(self, u: str, v: str, weight: float) -> float:
+        """Change one lane of a CSR-backed engine; returns the old weight."""
+        if not isinstance(self.graph, CSRGraph):
+            raise TypeError("Edit networkx galaxies through StarWarsGalaxy.set_weight")
+        old_weight = self.csr.edge_weight(u, v)
+        if not self.csr.set_weight(u, v, weight):
+            raise ValueError(f"Cannot store weight {weight!r} for lane {u} - {v}")
+
+        self._edits += 1
+        self._version = self._edits
+        if self.cache is not None:
+            self.cache.entries.clear()
+        # Landmark bounds survive weight increases only
+        if weight < old_weight:
+            self.landmarks = None
+        return old_weight
+
+    def use_landmarks(self, landmarks: "LandmarkIndex"):
+        """Attach a precomputed landmark index for method="alt" queries."""
+        if landmarks.nodes != self.csr.nodes:
+            raise ValueError("Landmark index was built for a different graph")
+        self.landmarks = landmarks
+
+    def _trace(self, previous: list, node: int) -> list[int]:
+        path = []
+        while node != -1:
+            path.append(node)
+            node = previous[node]
+        path.reverse()
+        return path
+
+    def _search(self, source: int, goals: set[int] | None = None) -> tuple[list, list]:
+        """Run Dijkstra over node ids, stop early once all goals are settled (if given)."""
+        if self.queue != "heapq":
+            return self._search_with_queue(source, goals)
+
+        csr = self.csr
+        offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+        n = len(csr)
+
+        distances = [float("inf")] * n
+        previous = [-1] * n
+        visited = bytearray(n)
+        distances[source] = 0
+
+        pending = set(goals) if goals is not None else None
+        settled = 0
+
+        heap = [(0, source)]
         while heap:
             current_dist, current = heapq.heappop(heap)
-            if current in visited:
+            if visited[current]:
                 continue
-            visited.add(current)
+            visited[current] = 1
+            settled += 1
+            if pending is not None and current in pending:
+                pending.discard(current)
+                if not pending:
+                    break
+
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[i]
+                if visited[neighbor]:
+                    continue
+                distance = current_dist + weights[i]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous[neighbor] = current
+                    heapq.heappush(heap, (distance, neighbor))
+
+        self.settled = settled
+        return distances, previous
+
+    def _search_with_queue(self, source: int, goals: set[int] | None = None) -> tuple[list, list]:
+        """Same search as _search on a decrease-key queue, so each planet is queued once."""
+        csr = self.csr
+        offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+        n = len(csr)
+
+        max_weight = None
+        if self.queue == "dial":
+            if weights.typecode != "q":
+                raise ValueError("Dial's bucket queue needs integer weights")
+            max_weight = max(weights, default=0)
+        queue = self.QUEUES[self.queue](n, max_weight)
+
+        distances = [float("inf")] * n
+        previous = [-1] * n
+        visited = bytearray(n)
+        distances[source] = 0
+
+        pending = set(goals) if goals is not None else None
+        settled = 0
+
+        queue.push(source, 0)
+        while queue:
+            current_dist, current = queue.pop()
+            visited[current] = 1
+            settled += 1
+            if pending is not None and current in pending:
+                pending.discard(current)
+                if not pending:
+                    break
+
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[i]
+                if visited[neighbor]:
+                    continue
+                distance = current_dist + weights[i]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous[neighbor] = current
+                    queue.push(neighbor, distance)
+
+        self.settled = settled
+        return distances, previous
+
+    def _bidirectional(self, source: int, goal: int) -> tuple[list[int], float]:
+        """Grow one search from source and one from goal until their frontiers meet."""
+        graphs = (self.csr, self.csr.reversed())
+        n = len(self.csr)
+        inf = float("inf")
+
+        distances = ([inf] * n, [inf] * n)
+        previous = ([-1] * n, [-1] * n)
+        visited = (bytearray(n), bytearray(n))
+        distances[0][source] = 0
+        distances[1][goal] = 0
+        heaps = ([(0, source)], [(0, goal)])
+
+        best = 0 if source == goal else inf
+        meet = goal
+        settled = 0
+
+        while heaps[0] and heaps[1]:
+            # No path through unsettled nodes can beat the best meeting found so far
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+
+            current_dist, current = heapq.heappop(heaps[side])
+            if visited[side][current]:
+                continue
+            visited[side][current] = 1
+            settled += 1
+
+            graph = graphs[side]
+            dist, prev, other = distances[side], previous[side], distances[1 - side]
+            for i in range(graph.offsets[current], graph.offsets[current + 1]):
+                neighbor = graph.targets[i]
+                distance = current_dist + graph.weights[i]
+                if distance < dist[neighbor]:
+                    dist[neighbor] = distance
+                    prev[neighbor] = current
+                    heapq.heappush(heaps[side], (distance, neighbor))
+                if dist[neighbor] + other[neighbor] < best:
+                    best = dist[neighbor] + other[neighbor]
+                    meet = neighbor
+
+        self.settled = settled
+        if best == inf:
+            return [goal], inf
+
+        # Forward half ends at the meeting node, backward half walks on to the goal
+        path = self._trace(previous[0], meet)
+        node = previous[1][meet]
+        while node != -1:
+            path.append(node)
+            node = previous[1][node]
+        return path, best
+
+    def _astar(self, source: int, goal: int, heuristic) -> tuple[list[int], float]:
+        """A* over node ids; heuristic(node_id) must never overestimate the distance to goal."""
+        n = len(self.csr)
+        offsets, targets, weights = self.csr.offsets, self.csr.targets, self.csr.weights
+
+        distances = [float("inf")] * n
+        previous = [-1] * n
+        distances[source] = 0
+        settled = 0
+
+        heap = [(heuristic(source), 0, source)]
+        while heap:
+            _, current_dist, current = heapq.heappop(heap)
+            # Stale entry; re-expansion stays allowed so inconsistent heuristics are still exact
+            if current_dist > distances[current]:
+                continue
+            settled += 1
             if current == goal:
                 break
 
-            for neighbor in self.graph.neighbors(current):
-                if neighbor in visited:
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[i]
+                distance = current_dist + weights[i]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous[neighbor] = current
+                    heapq.heappush(heap, (distance + heuristic(neighbor), distance, neighbor))
+
+        self.settled = settled
+        return self._trace(previous, goal), distances[goal]
+
+    def shortest_path(self, start: str, goal: str, method: str = "dijkstra",
+                      heuristic=None) -> tuple[list[str], int]:
+        """
+        Point-to-point route. method is "dijkstra", "bidirectional", "astar" or "alt";
+        A* needs an admissible heuristic(planet, goal) such as euclidean_heuristic,
+        ALT uses the attached LandmarkIndex.
+        """
+        self._sync()
+        if self.cache is not None:
+            cached = self.cache.get((start, goal), self._version, self._graph_changes())
+            if cached is not None:
+                return cached
+
+        source, target = self.csr.index[start], self.csr.index[goal]
+
+        if method == "dijkstra":
+            distances, previous = self._search(source, {target})
+            path, distance = self._trace(previous, target), distances[target]
+        elif method == "bidirectional":
+            path, distance = self._bidirectional(source, target)
+        elif method == "astar":
+            if heuristic is None:
+                raise ValueError("A* search requires a heuristic")
+            nodes = self.csr.nodes
+            path, distance = self._astar(source, target, lambda node: heuristic(nodes[node], goal))
+        elif method == "alt":
+            if self.landmarks is None:
+                raise ValueError("ALT search requires a landmark index")
+            path, distance = self._astar(source, target, self.landmarks.heuristic(target, source))
+        else:
+            raise ValueError(f"Unknown search method: {method}")
+
+        path = [self.csr.nodes[node] for node in path]
+        if self.cache is not None:
+            self.cache.put((start, goal), path, distance, self._version)
+        return path, distance
+
+    def batch(self, pairs: list[tuple[str, str]]) -> BatchResult:
+        """
+        Answer many (start, goal) queries with one search per distinct start,
+        each stopping as soon as all of its goals are settled.
+        Routes come back in input order.
+        """
+        began = time.perf_counter()
+        self._sync()
+        index = self.csr.index
+        routes = [None] * len(pairs)
+
+        # Group pending queries by source
+        by_source = {}
+        for position, (start, goal) in enumerate(pairs):
+            if self.cache is not None:
+                routes[position] = self.cache.get((start, goal), self._version, self._graph_changes())
+                if routes[position] is not None:
+                    continue
+            by_source.setdefault(index[start], []).append((position, index[goal]))
+
+        settled = 0
+        for source, queries in by_source.items():
+            distances, previous = self._search(source, {goal for _, goal in queries})
+            settled += self.settled
+            for position, goal in queries:
+                path = [self.csr.nodes[node] for node in self._trace(previous, goal)]
+                routes[position] = (path, distances[goal])
+                if self.cache is not None:
+                    self.cache.put(pairs[position], path, distances[goal], self._version)
+
+        return BatchResult(routes, time.perf_counter() - began, len(by_source), settled)
+
+    def single_source(self, start: str) -> ShortestPathTree:
+        """Shortest paths from start to every reachable planet in one run."""
+        self._sync()
+        source = self.csr.index[start]
+        distances, previous = self._search(source)
+        return ShortestPathTree(self.csr, source, distances, previous)
+
+    def all_paths(self, backend: str = "auto") -> Mapping:
+        """
+        Planet -> {goal: {"path", "distance"}} for every pair, paths built lazily.
+        backend "dijkstra" runs one search per source, "matrix" runs vectorized
+        Floyd-Warshall; "auto" picks whichever the cost model above expects to be faster.
+        """
+        self._sync()
+        if backend == "auto":
+            n, edges = len(self.csr), len(self.csr.targets)
+            matrix = self.MATRIX_COST * n ** 3
+            searches = n * (self.SEARCH_POP_COST * n * math.log2(max(n, 2)) + self.SEARCH_EDGE_COST * edges)
+            backend = "matrix" if n <= self.MATRIX_MAX_NODES and matrix < searches else "dijkstra"
+
+        if backend == "matrix":
+            return DistanceMatrix.floyd_warshall(self.csr)
+        if backend == "dijkstra":
+            return {start: self.single_source(start) for start in self.csr.nodes}
+        raise ValueError(f"Unknown all-pairs backend: {backend}")
+
+    def distance_rows(self, processes: int | None = None, chunksize: int = 64):
+        """
+        Stream the all-pairs distance matrix as (planet, float64 row) pairs,
+        with sources split into chunks across a process pool.
+        Rows arrive in completion order; row[i] is the distance to csr.nodes[i].
+        """
+        self._sync()
+        n = len(self.csr)
+        chunks = [range(i, min(i + chunksize, n)) for i in range(0, n, chunksize)]
+
+        # Forked workers inherit the CSR arrays as-is, nothing is pickled;
+        # spawned workers receive the compact CSR once, never per task
+        method = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+        pool = mp.get_context(method).Pool(processes, _init_worker, (self.csr, self.queue))
+
+        with pool:
+            for rows in pool.imap_unordered(_distance_rows, chunks):
+                for source, row in rows:
+                    yield self.csr.nodes[source], row
+
+
+# Engine used inside distance_rows worker processes
+_WORKER_ENGINE = None
+
+
+def _init_worker(csr: CSRGraph, queue: str):
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = Dijkstra(csr, queue=queue)
+
+
+def _distance_rows(sources: range) -> list[tuple[int, array]]:
+    return [(source, array("d", _WORKER_ENGINE._search(source)[0])) for source in sources]
+
+
+class DynamicShortestPathTree(ShortestPathTree):
+    """
+    Single-source tree kept up to date under lane weight changes (Ramalingam-Reps):
+    only the subtree below a more expensive tree lane and the planets reached
+    through a cheaper lane are recomputed, never the whole galaxy.
+    """
+
+    def __init__(self, dijkstra: Dijkstra, start: str):
+        tree = dijkstra.single_source(start)
+        super().__init__(tree.graph, tree._source, tree._distances, tree._previous)
+        self.dijkstra = dijkstra
+        self._version = dijkstra._version
+        self.touched = 0    # planets recomputed by the last repair
+
+    def refresh(self):
+        """Apply edits made through StarWarsGalaxy since the last refresh."""
+        version = self.dijkstra._graph_version()
+        if version == self._version:
+            return
+
+        changes = _changes_since(self.dijkstra._graph_changes(), self._version)
+        self.dijkstra._sync()
+        if self.graph is self.dijkstra.csr and len(changes) == version - self._version:
+            self._repair([(c.u, c.v, c.old_weight, c.new_weight) for c in changes])
+        else:
+            # New lanes or planets changed the CSR layout: start over
+            tree = self.dijkstra.single_source(self.source)
+            self.graph, self._source = tree.graph, tree._source
+            self._distances, self._previous = tree._distances, tree._previous
+            self.touched = len(self.graph)
+        self._version = version
+
+    def update_weight(self, u: str, v: str, weight: float):
+        """Change one lane of a CSR-backed engine (see Dijkstra.set_weight) and repair the tree."""
+        if not isinstance(self.dijkstra.graph, CSRGraph):
+            raise TypeError("Edit networkx galaxies through StarWarsGalaxy.set_weight, then refresh()")
+        self.refresh()
+        old_weight = self.dijkstra.set_weight(u, v, weight)
+        self._repair([(u, v, old_weight, weight)])
+        self._version = self.dijkstra._version
+
+    def _repair(self, changes: list[tuple]):
+        graph, reverse = self.graph, self.graph.reversed()
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        distances, previous = self._distances, self._previous
+        inf = float("inf")
+
+        # 1. More expensive tree lanes: cut off every planet hanging below them
+        cut = bytearray(len(graph))
+        affected = []
+        for u, v, old_weight, new_weight in changes:
+            if new_weight <= old_weight:
+                continue
+            a, b = graph.index[u], graph.index[v]
+            lanes = [(a, b)] if graph.directed else [(a, b), (b, a)]
+            for parent, child in lanes:
+                if previous[child] != parent or cut[child]:
                     continue
-                weight = self.graph[current][neighbor].get("weight", 1)
-                distance = current_dist + weight
+                cut[child] = 1
+                stack = [child]
+                while stack:
+                    node = stack.pop()
+                    affected.append(node)
+                    for i in range(offsets[node], offsets[node + 1]):
+                        below = targets[i]
+                        if previous[below] == node and not cut[below]:
+                            cut[below] = 1
+                            stack.append(below)
+
+        for node in affected:
+            distances[node] = inf
+            previous[node] = -1
+
+        # Re-attach cut planets through their best lane into the intact tree
+        heap = []
+        for node in affected:
+            for i in range(reverse.offsets[node], reverse.offsets[node + 1]):
+                parent = reverse.targets[i]
+                if not cut[parent] and distances[parent] + reverse.weights[i] < distances[node]:
+                    distances[node] = distances[parent] + reverse.weights[i]
+                    previous[node] = parent
+            if distances[node] != inf:
+                heapq.heappush(heap, (distances[node], node))
+
+        # 2. Any changed lane (at its current weight) may now be a shortcut
+        for u, v, _, _ in changes:
+            a, b = graph.index[u], graph.index[v]
+            for x, y in ([(a, b)] if graph.directed else [(a, b), (b, a)]):
+                distance = distances[x] + weights[graph._position(x, y)]
+                if distance < distances[y]:
+                    distances[y] = distance
+                    previous[y] = x
+                    heapq.heappush(heap, (distance, y))
+
+        # 3. Dijkstra limited to planets whose distance actually moved
+        touched = len(affected)
+        while heap:
+            current_dist, current = heapq.heappop(heap)
+            if current_dist > distances[current]:
+                continue
+            touched += 1
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[i]
+                distance = current_dist + weights[i]
                 if distance < distances[neighbor]:
                     distances[neighbor] = distance
                     previous[neighbor] = current
                     heapq.heappush(heap, (distance, neighbor))
 
-        # Reconstruct path
-        path = []
-        cur = goal
-        while cur is not None:
-            path.append(cur)
-            cur = previous[cur]
-        path.reverse()
-        return path, distances[goal]
-
-    def all_paths(self) -> dict:
-        nodes = list(self.graph.nodes)
-        results = {}
-        for start in nodes:
-            results[start] = {}
-            for goal in nodes:
-                if start != goal:
-                    path, distance = self.shortest_path(start, goal)
-                    results[start][goal] = {"path": path, "distance": distance}
-        return results
+        self.touched = touched
+
+    # Reads always see the current galaxy
+    def distance_to(self, goal: str) -> float:
+        self.refresh()
+        return super().distance_to(goal)
+
+    def path_to(self, goal: str) -> list[str]:
+        self.refresh()
+        return super().path_to(goal)
+
+    def __iter__(self):
+        self.refresh()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self.refresh()
+        return super().__len__()
+
+
+class LandmarkIndex:
+    """
+    ALT index: exact distances from/to K landmark planets.
+    By the triangle inequality |d(L, goal) - d(L, v)| never exceeds d(v, goal),
+    which gives A* a strong lower bound without any coordinates.
+    """
+
+    MAGIC = b"ALTIDX1\n"
+
+    # Landmarks consulted per query (those with the best source -> goal bound)
+    ACTIVE_LANDMARKS = 4
+
+    def __init__(self, nodes: list, landmarks: list[int], distances_from, distances_to):
+        self.nodes = nodes
+        self.landmarks = landmarks
+        # Flat K x V rows: distances_from[k * V + v] = d(landmark k, v)
+        self.distances_from = distances_from
+        # distances_to[k * V + v] = d(v, landmark k); same buffer for undirected graphs
+        self.distances_to = distances_to
+
+    @classmethod
+    def build(cls, dijkstra: Dijkstra, k: int = 8) -> "LandmarkIndex":
+        """Start from the main hub, then keep adding the planet farthest from all landmarks."""
+        csr = dijkstra.csr
+        n = len(csr)
+        reverse = Dijkstra(csr.reversed()) if csr.directed else None
+        offsets = csr.offsets
+
+        hub = max(range(n), key=lambda node: offsets[node + 1] - offsets[node])
+        landmarks = []
+        distances_from = array("d")
+        distances_to = array("d") if csr.directed else distances_from
+        closest = [float("inf")] * n   # distance to the nearest chosen landmark
+
+        candidate = hub
+        while len(landmarks) < min(k, n):
+            landmarks.append(candidate)
+            row, _ = dijkstra._search(candidate)
+            distances_from.extend(row)
+            if reverse is not None:
+                distances_to.extend(reverse._search(candidate)[0])
+
+            closest = [min(a, b) for a, b in zip(closest, row)]
+            reachable = [node for node in range(n) if closest[node] != float("inf")]
+            candidate = max(reachable, key=closest.__getitem__)
+            if closest[candidate] == 0:
+                break   # every reachable planet is already a landmark
+
+        return cls(csr.nodes, landmarks, distances_from, distances_to)
+
+    def heuristic(self, goal: int, source: int | None = None, active: int | None = None):
+        """
+        Lower bound on d(node, goal) for node ids, ready for Dijkstra._astar.
+        The bounds of every planet are computed up front as one NumPy pass, so A* pays a
+        list lookup per relaxation instead of a Python loop over the landmarks. Given the
+        query source, only the `active` landmarks with the best (source, goal) bound are used.
+        """
+        n = len(self.nodes)
+        rows_from = np.frombuffer(self.distances_from, dtype=np.float64).reshape(-1, n)
+        rows_to = np.frombuffer(self.distances_to, dtype=np.float64).reshape(-1, n)
+
+        with np.errstate(invalid="ignore"):
+            if source is not None:
+                active = self.ACTIVE_LANDMARKS if active is None else active
+                at_source = np.fmax(rows_from[:, goal] - rows_from[:, source],
+                                    rows_to[:, source] - rows_to[:, goal])
+                # Unreachable pairs give nan (inf - inf): rank those last
+                chosen = np.argsort(-np.nan_to_num(at_source, nan=-np.inf), kind="stable")[:active]
+                rows_from, rows_to = rows_from[chosen], rows_to[chosen]
+
+            bounds = np.fmax(rows_from[:, goal, None] - rows_from, rows_to - rows_to[:, goal, None])
+            estimates = np.fmax(np.fmax.reduce(bounds, axis=0), 0)
+
+        return estimates.tolist().__getitem__
+
+    # PERSISTENCE
+    def save(self, path: str):
+        """Write header + raw float64 rows so load() can memory-map them."""
+        header = json.dumps({
+            "nodes": self.nodes,
+            "landmarks": self.landmarks,
+            "directed": self.distances_to is not self.distances_from,
+            "byteorder": sys.byteorder,
+        }).encode()
+        # Pad so the distance rows start 8-byte aligned
+        padding = -(len(self.MAGIC) + 8 + len(header)) % 8
+
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<Q", len(header) + padding))
+            f.write(header + b" " * padding)
+            f.write(memoryview(self.distances_from).cast("B"))
+            if self.distances_to is not self.distances_from:
+                f.write(memoryview(self.distances_to).cast("B"))
+
+    @classmethod
+    def load(cls, path: str) -> "LandmarkIndex":
+        """Memory-map a saved index; workers loading the same file share its pages."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mapped[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f"{path} is not a landmark index")
+        start = len(cls.MAGIC) + 8
+        (header_size,) = struct.unpack("<Q", mapped[len(cls.MAGIC):start])
+        header = json.loads(mapped[start:start + header_size])
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} was written on a {header['byteorder']}-endian machine")
+
+        rows = memoryview(mapped)[start + header_size:].cast("d")
+        size = len(header["landmarks"]) * len(header["nodes"])
+        distances_from = rows[:size]
+        distances_to = rows[size:2 * size] if header["directed"] else distances_from
+        return cls(header["nodes"], header["landmarks"], distances_from, distances_to)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+import random
+import time
+from task6_food_selection import (
+    dynamic_programming,
+    dynamic_programming_compact,
+    dynamic_programming_numpy,
+)
+
+
+def generated_menu(size: int, max_cost: int, seed: int) -> dict:
+    """Random menu in the ITEMS format."""
+    rng = random.Random(seed)
+    return {
+        f"food-{i}": {"cost": rng.randint(1, max_cost), "calories": rng.randint(10, 1000)}
+        for i in range(size)
+    }
+
+
+def benchmark_dynamic_programming(cases=((100, 1_000), (100, 10_000), (200, 50_000)), seed: int = 42):
+    """Time the table, O(budget)-memory and NumPy solvers on the same menus."""
+    solvers = {
+        "table": dynamic_programming,
+        "compact": dynamic_programming_compact,
+        "numpy": dynamic_programming_numpy,
+    }
+
+    header = f"{'Items':<8}{'Budget':<10}" + "".join(f"{name:<12}" for name in solvers)
+    print(header)
+    print("-" * len(header))
+
+    for size, budget in cases:
+        menu = generated_menu(size, max_cost=budget // 10, seed=seed)
+        row = f"{size:<8}{budget:<10,}"
+        calories = set()
+        for solver in solvers.values():
+            began = time.perf_counter()
+            calories.add(solver(menu, budget)[1])
+            row += f"{time.perf_counter() - began:<12.3f}"
+        assert len(calories) == 1, "solvers disagree"
+        print(row)
+
+    print("\nSeconds per solve")
+
+
+if __name__ == "__main__":
+    benchmark_dynamic_programming()
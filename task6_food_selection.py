@@ -1,3 +1,6 @@
+import math
+import numpy as np
+
 ITEMS = {
     "pizza": {"cost": 50, "calories": 300},
     "hamburger": {"cost": 40, "calories": 250},
@@ -65,6 +68,319 @@ def dynamic_programming(items, budget):
     return selected, table[num_items][budget]
 
 
+def dynamic_programming_numpy(items, budget):
+    """
+    Same result as dynamic_programming: each item row is one shifted element-wise
+    maximum of the previous row, and only a boolean "took it" table is kept for backtracking.
+    """
+    food_names = list(items.keys())
+    row = np.zeros(budget + 1, dtype=np.int64)
+    took = np.zeros((len(food_names), budget + 1), dtype=bool)
+
+    for item_index, food_name in enumerate(food_names):
+        food_cost = items[food_name]["cost"]
+        food_calories = items[food_name]["calories"]
+        if food_cost > budget:
+            continue
+
+        with_this_food = row[:budget + 1 - food_cost] + food_calories
+        took[item_index, food_cost:] = with_this_food > row[food_cost:]
+        np.maximum(row[food_cost:], with_this_food, out=row[food_cost:])
+
+    selected = []
+    remaining_budget = budget
+    for item_index in range(len(food_names) - 1, -1, -1):
+        if took[item_index, remaining_budget]:
+            food_name = food_names[item_index]
+            selected.append(food_name)
+            remaining_budget -= items[food_name]["cost"]
+
+    return selected, int(row[budget])
+
+
+def _bit(packed, i):
+    # Bit i of a np.packbits row (big-endian bit order within each byte)
+    return packed[i >> 3] >> (7 - (i & 7)) & 1
+
+
+class KnapsackIndex:
+    """
+    One DP pass up to max_budget, answering any budget <= max_budget afterwards:
+    the best calories per budget are one int row, and the "took it" table is packed
+    to one bit per (item, budget) so a selection is rebuilt in O(n).
+    """
+
+    def __init__(self, items, max_budget):
+        self.food_names = list(items.keys())
+        self.costs = [items[name]["cost"] for name in self.food_names]
+        self.max_budget = max_budget
+
+        row = np.zeros(max_budget + 1, dtype=np.int64)
+        self.took = np.zeros((len(self.food_names), (max_budget + 8) // 8), dtype=np.uint8)
+        for item_index, food_name in enumerate(self.food_names):
+            food_cost = self.costs[item_index]
+            if food_cost > max_budget:
+                continue
+
+            took = np.zeros(max_budget + 1, dtype=bool)
+            with_this_food = row[:max_budget + 1 - food_cost] + items[food_name]["calories"]
+            took[food_cost:] = with_this_food > row[food_cost:]
+            np.maximum(row[food_cost:], with_this_food, out=row[food_cost:])
+            self.took[item_index] = np.packbits(took)
+        self.best = row
+
+    def query(self, budget):
+        if not 0 <= budget <= self.max_budget:
+            raise ValueError(f"budget must be between 0 and {self.max_budget}")
+
+        selected = []
+        remaining_budget = budget
+        for item_index in range(len(self.food_names) - 1, -1, -1):
+            if _bit(self.took[item_index], remaining_budget):
+                selected.append(self.food_names[item_index])
+                remaining_budget -= self.costs[item_index]
+
+        return selected, int(self.best[budget])
+
+
+INDEX_CACHE_SIZE = 8
+_INDEX_CACHE = {}
+
+
+def _catalogue_fingerprint(items):
+    return tuple((name, info["cost"], info["calories"]) for name, info in items.items())
+
+
+def knapsack_index(items, max_budget):
+    """
+    Cached KnapsackIndex per catalogue version: any change to the items (names, costs,
+    calories or order) gives a new fingerprint and a fresh index.
+    """
+    fingerprint = _catalogue_fingerprint(items)
+    index = _INDEX_CACHE.pop(fingerprint, None)
+    if index is None or index.max_budget < max_budget:
+        index = KnapsackIndex(items, max_budget)
+    _INDEX_CACHE[fingerprint] = index  # re-insert as most recent
+
+    while len(_INDEX_CACHE) > INDEX_CACHE_SIZE:
+        del _INDEX_CACHE[next(iter(_INDEX_CACHE))]
+    return index
+
+
+def dynamic_programming_batch(items, budgets):
+    """Best selection for every budget in budgets from one cached DP pass."""
+    budgets = list(budgets)
+    if not budgets:
+        return []
+    index = knapsack_index(items, max(budgets))
+    return [index.query(budget) for budget in budgets]
+
+
+def _quantity_chunks(items, dimension):
+    # Binary splitting: quantity q becomes chunks 1, 2, 4, ..., remainder, so any
+    # count 0..q is a sum of distinct chunks and each chunk is a 0/1 item
+    for food_name, info in items.items():
+        quantity = info.get("quantity", 1)
+        size = 1
+        while quantity > 0:
+            size = min(size, quantity)
+            yield food_name, size, info["cost"] * size, info.get(dimension, 0) * size, info["calories"] * size
+            quantity -= size
+            size *= 2
+
+
+def bounded_knapsack(items, budget, capacity=None, dimension="weight"):
+    """
+    Up to items[name]["quantity"] (default 1) of each food within the budget and, if
+    capacity is given, with the total of items[name][dimension] within capacity too.
+    Quantities are split into O(log q) 0/1 chunks instead of q duplicates; the DP is a
+    (budget x capacity) NumPy plane and each chunk keeps only a bit-packed "took it" mask.
+    Returns ({food: quantity}, total calories).
+    """
+    if capacity is None:
+        capacity, dimension = 0, None
+    shape = (budget + 1, capacity + 1)
+
+    plane = np.zeros(shape, dtype=np.int64)
+    chunks = []
+    for food_name, size, cost, extra, calories in _quantity_chunks(items, dimension):
+        if cost > budget or extra > capacity:
+            continue
+
+        with_this_food = plane[:budget + 1 - cost, :capacity + 1 - extra] + calories
+        took = np.zeros(shape, dtype=bool)
+        took[cost:, extra:] = with_this_food > plane[cost:, extra:]
+        np.maximum(plane[cost:, extra:], with_this_food, out=plane[cost:, extra:])
+        chunks.append((food_name, size, cost, extra, np.packbits(took)))
+
+    quantities = {}
+    money, room = budget, capacity
+    for food_name, size, cost, extra, mask in reversed(chunks):
+        if _bit(mask, money * shape[1] + room):
+            quantities[food_name] = quantities.get(food_name, 0) + size
+            money -= cost
+            room -= extra
+
+    return quantities, int(plane[budget, capacity])
+
+
+def _best_by_budget(food_names, items, budget):
+    # Rolling row: row[money] = best calories from food_names within money
+    row = [0] * (budget + 1)
+    for food_name in food_names:
+        food_cost = items[food_name]["cost"]
+        food_calories = items[food_name]["calories"]
+        for money in range(budget, food_cost - 1, -1):
+            with_this_food = row[money - food_cost] + food_calories
+            if with_this_food > row[money]:
+                row[money] = with_this_food
+    return row
+
+
+def dynamic_programming_compact(items, budget):
+    """
+    Exact like dynamic_programming but in O(budget) memory: one rolling row per half
+    of the menu, and the selection is rebuilt Hirschberg-style by finding how the
+    budget splits between the halves and recursing into each.
+    """
+    def solve(food_names, money):
+        if len(food_names) == 1:
+            info = items[food_names[0]]
+            return list(food_names) if info["cost"] <= money and info["calories"] > 0 else []
+
+        mid = len(food_names) // 2
+        left = _best_by_budget(food_names[:mid], items, money)
+        right = _best_by_budget(food_names[mid:], items, money)
+        split = max(range(money + 1), key=lambda spent: left[spent] + right[money - spent])
+        del left, right  # only one pair of rows is alive at a time
+
+        return solve(food_names[:mid], split) + solve(food_names[mid:], money - split)
+
+    selected = solve(list(items), budget) if items else []
+    return selected, sum(items[name]["calories"] for name in selected)
+
+
+def _by_ratio(items, budget):
+    # Affordable foods with calories, best calories per cost first (free foods lead)
+    return sorted(
+        (
+            (name, info) for name, info in items.items()
+            if info["cost"] <= budget and info["calories"] > 0
+        ),
+        key=lambda x: x[1]["calories"] / x[1]["cost"] if x[1]["cost"] else math.inf,
+        reverse=True
+    )
+
+
+def fptas(items, budget, epsilon=0.1):
+    """
+    Approximation within (1 - epsilon) of the optimum, independent of the budget.
+    Calories are scaled by epsilon * lower / n, where lower is the greedy bound
+    (optimum <= 2 * lower), so at most 2n / epsilon scaled totals exist; the DP finds
+    the cheapest way to reach each one in O(n^2 / epsilon) time, keeping a bit-packed
+    "took it" table of about n^2 / (4 * epsilon) bytes. Costs may be fractional.
+    """
+    ordered = _by_ratio(items, budget)
+    if not ordered:
+        return [], 0
+
+    # Greedy prefix plus the first food that no longer fits bounds the optimum
+    spent, prefix, upper = 0, 0, 0
+    for _, info in ordered:
+        if spent + info["cost"] > budget:
+            upper = prefix + info["calories"]
+            break
+        spent += info["cost"]
+        prefix += info["calories"]
+    else:
+        upper = prefix
+    lower = max(prefix, max(info["calories"] for _, info in ordered))
+
+    food_names = [name for name, _ in ordered]
+    scale = max(1.0, epsilon * lower / len(food_names))
+    scaled = [int(items[name]["calories"] // scale) for name in food_names]
+    total = min(sum(scaled), int(upper // scale))
+
+    min_cost = np.full(total + 1, np.inf)
+    min_cost[0] = 0
+    took = np.zeros((len(food_names), (total + 8) // 8), dtype=np.uint8)
+
+    for item_index, (food_name, value) in enumerate(zip(food_names, scaled)):
+        with_this_food = min_cost[:total + 1 - value] + items[food_name]["cost"]
+        better = np.zeros(total + 1, dtype=bool)
+        better[value:] = with_this_food < min_cost[value:]
+        np.minimum(min_cost[value:], with_this_food, out=min_cost[value:])
+        took[item_index] = np.packbits(better)
+
+    value = int(np.flatnonzero(min_cost <= budget).max())
+    selected = []
+    for item_index in range(len(food_names) - 1, -1, -1):
+        if _bit(took[item_index], value):
+            selected.append(food_names[item_index])
+            value -= scaled[item_index]
+
+    return selected, sum(items[name]["calories"] for name in selected)
+
+
+def branch_and_bound(items, budget):
+    """
+    Exact depth-first search in greedy ratio order; a branch is dropped when even the
+    fractional (greedy fill) upper bound cannot beat the best selection found so far.
+    Works with fractional costs and any budget size.
+    """
+    ordered = _by_ratio(items, budget)
+    costs = [info["cost"] for _, info in ordered]
+    calories = [info["calories"] for _, info in ordered]
+    count = len(ordered)
+
+    def upper_bound(index, spent, gained):
+        for i in range(index, count):
+            if spent + costs[i] > budget:
+                return gained + (budget - spent) * calories[i] / costs[i]
+            spent += costs[i]
+            gained += calories[i]
+        return gained
+
+    best_calories, best_taken = 0, None
+    # Chosen items are a linked chain (index, previous) so pushing a branch is O(1)
+    stack = [(0, 0, 0, None)]
+    while stack:
+        index, spent, gained, taken = stack.pop()
+        if gained > best_calories:
+            best_calories, best_taken = gained, taken
+        if index == count or upper_bound(index, spent, gained) <= best_calories:
+            continue
+
+        stack.append((index + 1, spent, gained, taken))
+        if spent + costs[index] <= budget:
+            stack.append((index + 1, spent + costs[index], gained + calories[index], (index, taken)))
+
+    selected = []
+    while best_taken:
+        index, best_taken = best_taken
+        selected.append(ordered[index][0])
+    selected.reverse()
+    return selected, best_calories
+
+
+# Largest item x budget table solve() hands to the exact NumPy DP (bytes of the "took it" table)
+DP_CELL_LIMIT = 50_000_000
+
+
+def solve(items, budget, epsilon=0.0):
+    """
+    Pick an engine from n, W and the accuracy asked for:
+    integer costs with a small n x W table -> exact NumPy DP,
+    epsilon > 0 -> FPTAS, otherwise exact branch-and-bound.
+    """
+    integral = isinstance(budget, int) and all(isinstance(info["cost"], int) for info in items.values())
+    if integral and budget >= 0 and len(items) * (budget + 1) <= DP_CELL_LIMIT:
+        return dynamic_programming_numpy(items, budget)
+    if epsilon > 0:
+        return fptas(items, budget, epsilon)
+    return branch_and_bound(items, budget)
+
+
 if __name__ == "__main__":
     balance = 115
 
@@ -82,4 +398,19 @@ if __name__ == "__main__":
     print(f"\nDynamic Programming:")
     print(f" -> Food: {dp_items}")
     print(f" -> Total calories: {dp_cal}")
-    print(f" -> Cost: {sum(ITEMS[i]['cost'] for i in dp_items)}")
\ No newline at end of file
+    print(f" -> Cost: {sum(ITEMS[i]['cost'] for i in dp_items)}")
+
+    compact_items, compact_cal = dynamic_programming_compact(ITEMS, balance)
+    print(f"\nDynamic Programming (O(budget) memory):")
+    print(f" -> Food: {compact_items}")
+    print(f" -> Total calories: {compact_cal}")
+    print(f" -> Cost: {sum(ITEMS[i]['cost'] for i in compact_items)}")
+
+    for label, (solver_items, solver_cal) in {
+        "FPTAS (epsilon=0.1)": fptas(ITEMS, balance, 0.1),
+        "Branch and Bound": branch_and_bound(ITEMS, balance),
+    }.items():
+        print(f"\n{label}:")
+        print(f" -> Food: {solver_items}")
+        print(f" -> Total calories: {solver_cal}")
+        print(f" -> Cost: {sum(ITEMS[i]['cost'] for i in solver_items)}")
@@ -1,11 +1,64 @@
 import random
+from fractions import Fraction
+from functools import lru_cache
+from itertools import chain
 import matplotlib.pyplot as plt
+import numpy as np
+
+# Above this many possible sums the float distribution is computed with one FFT power
+FFT_MIN_SUMS = 512
+
+
+def _polynomial_power(single, n, multiply):
+    # Exponentiation by squaring: O(log n) convolutions instead of n - 1
+    result = None
+    while n:
+        if n & 1:
+            result = single if result is None else multiply(result, single)
+        n >>= 1
+        if n:
+            single = multiply(single, single)
+    return result
+
+
+@lru_cache(maxsize=128)
+def _sum_distribution(n, faces, weights, exact):
+    if exact:
+        single = np.array([Fraction(w) for w in weights], dtype=object)
+        single /= sum(single)
+        return tuple(_polynomial_power(single, n, np.convolve))
+
+    single = np.asarray(weights, dtype=float)
+    single /= single.sum()
+    length = n * (faces - 1) + 1
+    if length < FFT_MIN_SUMS:
+        return tuple(_polynomial_power(single, n, np.convolve).tolist())
+
+    size = 1 << (length - 1).bit_length()
+    spectrum = np.fft.rfft(single, size) ** n
+    probabilities = np.clip(np.fft.irfft(spectrum, size)[:length], 0, None)
+    return tuple((probabilities / probabilities.sum()).tolist())
+
+
+def dice_distribution(n: int = 2, faces: int = 6, weights=None, exact: bool = False) -> dict:
+    """
+    Exact distribution of the sum of n dice with faces 1..faces, optionally weighted
+    per face: the single-die distribution convolved with itself n times (FFT for long
+    ranges). exact=True returns Fractions. Memoized by (n, faces, weights).
+    """
+    if n < 1 or faces < 1:
+        raise ValueError("need at least one die with at least one face")
+    weights = (1,) * faces if weights is None else tuple(weights)
+    if len(weights) != faces:
+        raise ValueError(f"expected {faces} face weights, got {len(weights)}")
+    if any(w < 0 for w in weights) or sum(weights) == 0:
+        raise ValueError("face weights must be non-negative and not all zero")
+
+    return dict(enumerate(_sum_distribution(n, faces, weights, exact), start=n))
+
 
 # Theoretical probabilities for sums of two dice
-THEORETICAL_PROB = {
-    total: count / 36
-    for total, count in zip(range(2, 13), [1, 2, 3, 4, 5, 6, 5, 4, 3, 2, 1])
-}
+THEORETICAL_PROB = {total: float(p) for total, p in dice_distribution(2, 6, exact=True).items()}
 
 
 def roll_two_dice(trials: int) -> dict:
@@ -17,23 +70,48 @@ def roll_two_dice(trials: int) -> dict:
     return {k: v / trials for k, v in outcomes.items()}
 
 
-def print_probability_table(probabilities: dict):
-    """Print comparison table of Monte Carlo vs theoretical probabilities."""
+# Sum of the two dice for each of the 36 equally likely outcomes (first * 6 + second)
+OUTCOME_SUMS = np.add.outer(np.arange(1, 7), np.arange(1, 7)).ravel()
+
+
+def roll_two_dice_numpy(trials: int, seed=None, batch_size: int = 1 << 22) -> dict:
+    """
+    Same result format as roll_two_dice: each batch draws outcome indices 0..35 from a
+    seeded Generator and tallies them with bincount, then the 36 counts map to sums.
+    """
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(36, dtype=np.int64)
+    for done in range(0, trials, batch_size):
+        batch = rng.integers(0, 36, size=min(batch_size, trials - done), dtype=np.uint8)
+        counts += np.bincount(batch, minlength=36)
+
+    totals = np.bincount(OUTCOME_SUMS, weights=counts, minlength=13)
+    return {k: float(totals[k]) / trials for k in range(2, 13)}
+
+
+def _sum_range(probabilities: dict, theoretical: dict) -> list:
+    return list(range(min(chain(probabilities, theoretical)), max(chain(probabilities, theoretical)) + 1))
+
+
+def print_probability_table(probabilities: dict, theoretical: dict = None):
+    """Print comparison table of Monte Carlo vs theoretical probabilities (two dice by default)."""
+    theoretical = THEORETICAL_PROB if theoretical is None else theoretical
     header = f"{'Sum':<6}{'Monte Carlo (%)':<20}{'Theoretical (%)':<18}{'Difference'}"
     print(header)
     print("-" * len(header))
-    for s in range(2, 13):
-        mc = probabilities[s] * 100
-        th = THEORETICAL_PROB[s] * 100
+    for s in _sum_range(probabilities, theoretical):
+        mc = probabilities.get(s, 0) * 100
+        th = theoretical.get(s, 0) * 100
         diff = abs(mc - th)
         print(f"{s:<6}{mc:<20.2f}{th:<18.2f}{diff:.4f}")
 
 
-def plot_probabilities(probabilities: dict, trials: int):
-    """Plot Monte Carlo and theoretical probabilities."""
-    sums = list(range(2, 13))
-    mc_vals = [probabilities[s] * 100 for s in sums]
-    th_vals = [THEORETICAL_PROB[s] * 100 for s in sums]
+def plot_probabilities(probabilities: dict, trials: int, theoretical: dict = None):
+    """Plot Monte Carlo and theoretical probabilities (two dice by default)."""
+    theoretical = THEORETICAL_PROB if theoretical is None else theoretical
+    sums = _sum_range(probabilities, theoretical)
+    mc_vals = [probabilities.get(s, 0) * 100 for s in sums]
+    th_vals = [theoretical.get(s, 0) * 100 for s in sums]
 
     plt.figure(figsize=(9, 5))
     plt.plot(sums, mc_vals, marker='o', label="Monte Carlo")
@@ -41,7 +119,8 @@ def plot_probabilities(probabilities: dict, trials: int):
     plt.title(f"Dice Roll Probabilities ({trials:,} rolls)")
     plt.xlabel("Sum")
     plt.ylabel("Probability (%)")
-    plt.xticks(sums)
+    if len(sums) <= 40:
+        plt.xticks(sums)
     plt.grid(alpha=0.4)
     plt.legend()
     plt.tight_layout()